@@ -9,13 +9,32 @@ Author: Simply-Python Contributors
 License: MIT
 """
 
+import logging
 import os
+import sys
 import time
 import threading
-from contextlib import contextmanager, ExitStack
-from typing import Optional, Any, Generator
+from contextlib import ExitStack
+from types import SimpleNamespace, TracebackType
+from typing import IO, Any, ClassVar, Final, List, Literal, Optional, Type, Union
 from datetime import datetime
 
+# Diagnostic messages go through logging instead of print. When DEBUG is
+# disabled, the isEnabledFor() check skips building the message entirely.
+logger = logging.getLogger(__name__)
+_log_debug = logger.debug
+_DEBUG = logging.DEBUG
+
+# Functions called inside __enter__/__exit__, bound once at import.
+# Looking up a module global is cheaper than looking up the global and
+# then an attribute on it (time.perf_counter) on every 'with' block.
+_perf_counter = time.perf_counter
+_time = time.time
+_os_open = os.open
+_os_close = os.close
+_os_chdir = os.chdir
+_os_getcwd = os.getcwd
+_datetime_fromtimestamp = datetime.fromtimestamp
 
 # =============================================================================
 # SECTION 1: Basic Context Manager Class
@@ -36,22 +55,60 @@ class FileManager:
     Attributes:
         filename: Path to the file
         mode: File open mode ('r', 'w', 'a', etc.)
+        buffering: Buffer size passed to open()
+        encoding: Text encoding passed to open() (text modes only)
     """
     
-    def __init__(self, filename: str, mode: str = 'r'):
+    __slots__ = ('filename', 'mode', 'buffering', 'encoding', 'file')
+    
+    # Default buffer for binary modes: large sequential reads and writes
+    # need far fewer system calls than with the small io.DEFAULT_BUFFER_SIZE
+    BINARY_BUFFER_SIZE: Final = 1 << 20  # 1 MiB
+    
+    def __init__(self, filename: Union[str, "os.PathLike[str]"], mode: str = 'r',
+                 buffering: int = -1, encoding: Optional[str] = None,
+                 binary: bool = False):
         """
         Initialize the FileManager.
         
         Args:
             filename: Path to the file to manage
             mode: Mode to open the file in (default: 'r' for read)
+            buffering: Buffer size as for open(); -1 picks the default,
+                which is 1 MiB for binary modes
+            encoding: Text encoding (default: the platform default)
+            binary: Open in binary mode, adding 'b' to mode if missing.
+                Binary files skip the text decoding layer
+                (io.TextIOWrapper and its codec) that text mode sets up.
         """
-        self.filename = filename
+        if binary and 'b' not in mode:
+            # 't' (explicit text mode) can't be combined with 'b'
+            mode = mode.replace('t', '') + 'b'
+        if buffering == -1 and 'b' in mode:
+            buffering = self.BINARY_BUFFER_SIZE
+        # Convert path-like objects once here rather than on every open()
+        self.filename = os.fspath(filename)
         self.mode = mode
-        self.file = None
-        print(f"[FileManager] Initialized for '{filename}' in mode '{mode}'")
+        self.buffering = buffering
+        self.encoding = encoding
+        self.file: Optional[IO[Any]] = None
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[FileManager] Initialized for '{self.filename}' "
+                       f"in mode '{mode}'")
+    
+    @classmethod
+    def binary(cls, filename: Union[str, "os.PathLike[str]"],
+               mode: str = 'rb') -> "FileManager":
+        """
+        Create a FileManager that opens the file in binary mode.
+        
+        Example:
+            with FileManager.binary('data.bin', 'wb') as f:
+                f.write(b'\x00\x01')
+        """
+        return cls(filename, mode, binary=True)
     
-    def __enter__(self):
+    def __enter__(self) -> IO[Any]:
         """
         Enter the context - open the file.
         
@@ -61,11 +118,14 @@ class FileManager:
         Returns:
             The opened file object
         """
-        print(f"[FileManager] Opening file '{self.filename}'")
-        self.file = open(self.filename, self.mode)
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[FileManager] Opening file '{self.filename}'")
+        self.file = open(self.filename, self.mode, self.buffering, self.encoding)
         return self.file
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
         """
         Exit the context - close the file.
         
@@ -81,11 +141,13 @@ class FileManager:
             False to propagate exceptions, True to suppress them
         """
         if self.file:
-            print(f"[FileManager] Closing file '{self.filename}'")
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[FileManager] Closing file '{self.filename}'")
             self.file.close()
         
-        if exc_type is not None:
-            print(f"[FileManager] Exception occurred: {exc_type.__name__}: {exc_val}")
+        if exc_type is not None and logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[FileManager] Exception occurred: "
+                       f"{exc_type.__name__}: {exc_val}")
         
         # Return False to propagate exceptions (don't suppress them)
         return False
@@ -103,6 +165,8 @@ class Timer:
     bottlenecks. The elapsed time is available after exiting.
     """
     
+    __slots__ = ('description', 'start_time', 'end_time', 'elapsed')
+    
     def __init__(self, description: str = "Operation"):
         """
         Initialize the Timer.
@@ -111,62 +175,151 @@ class Timer:
             description: Description of what's being timed
         """
         self.description = description
-        self.start_time: Optional[float] = None
+        self.start_time = 0.0
         self.end_time: Optional[float] = None
         self.elapsed: Optional[float] = None
     
-    def __enter__(self):
+    def __enter__(self) -> "Timer":
         """Start the timer when entering the context."""
-        self.start_time = time.perf_counter()
-        print(f"[Timer] Starting: {self.description}")
+        self.start_time = _perf_counter()
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Timer] Starting: {self.description}")
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
         """Stop the timer and calculate elapsed time."""
-        self.end_time = time.perf_counter()
+        self.end_time = _perf_counter()
         self.elapsed = self.end_time - self.start_time
-        print(f"[Timer] {self.description} took {self.elapsed:.6f} seconds")
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Timer] {self.description} took {self.elapsed:.6f} seconds")
+        return False
+
+
+class FastTimer:
+    """
+    A minimal timer for measuring code inside tight loops.
+    
+    Timer prints on entry and exit, and formatting and writing those
+    messages can cost more than the code being timed. FastTimer only
+    records the elapsed time; read it after the block.
+    
+    Example:
+        with FastTimer() as t:
+            do_work()
+        print(t.elapsed)
+    """
+    
+    __slots__ = ('start', 'elapsed')
+    
+    def __init__(self) -> None:
+        self.start = 0.0
+        self.elapsed = 0.0
+    
+    def __enter__(self) -> "FastTimer":
+        """Start the timer."""
+        self.start = _perf_counter()
+        return self
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        """Record the elapsed time."""
+        self.elapsed = _perf_counter() - self.start
         return False
 
 
 # =============================================================================
-# SECTION 3: Context Manager using @contextmanager
+# SECTION 3: Lightweight Context Manager Classes
 # =============================================================================
 
-@contextmanager
-def change_directory(path: str) -> Generator[str, None, None]:
+# os.fchdir is not available on every platform (e.g. Windows)
+_HAS_FCHDIR = hasattr(os, 'fchdir')
+if _HAS_FCHDIR:
+    _os_fchdir = os.fchdir
+_DIR_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+
+
+class ChangeDirectory:
     """
     A context manager that temporarily changes the working directory.
     
-    The @contextmanager decorator transforms a generator function
-    into a context manager. This is often simpler than writing
-    a full class.
-    
-    Structure:
-    1. Code before 'yield' runs on __enter__
-    2. The yielded value is bound to 'as' variable
-    3. Code after 'yield' runs on __exit__
+    This could be written as a generator decorated with @contextmanager,
+    which is often simpler than writing a full class. However,
+    @contextmanager wraps the generator in a helper object and has to
+    create, resume and close that generator on every 'with' block.
+    A plain class with __enter__/__exit__ avoids that machinery, which
+    matters when the context manager sits on a hot path.
     
     Args:
         path: Directory to change to
-        
-    Yields:
-        The new directory path
     """
-    original_dir = os.getcwd()
-    print(f"[Directory] Changing from '{original_dir}' to '{path}'")
     
-    try:
-        os.chdir(path)
-        yield path
-    finally:
-        # This runs on exit, even if an exception occurred
-        os.chdir(original_dir)
-        print(f"[Directory] Restored to '{original_dir}'")
+    __slots__ = ('path', '_fd', '_orig')
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._orig: Optional[str] = None
+    
+    def __enter__(self) -> str:
+        """Remember the current directory and change to the new one."""
+        # Entering again would overwrite the saved directory, which could
+        # then never be restored
+        if self._fd is not None or self._orig is not None:
+            raise RuntimeError("ChangeDirectory is not reentrant")
+        if _HAS_FCHDIR:
+            # Hold the current directory open: restoring through the file
+            # descriptor skips path resolution and still works if the
+            # directory is renamed while we are away
+            self._fd = _os_open('.', _DIR_FLAGS)
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[Directory] Changing to '{self.path}'")
+        else:
+            self._orig = _os_getcwd()
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[Directory] Changing from '{self._orig}' to '{self.path}'")
+        try:
+            _os_chdir(self.path)
+        except BaseException:
+            self._close()
+            self._orig = None
+            raise
+        return self.path
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        """Restore the original directory, even if an exception occurred."""
+        if self._fd is not None:
+            try:
+                _os_fchdir(self._fd)
+            finally:
+                self._close()
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug("[Directory] Restored original directory")
+        elif self._orig is not None:
+            orig, self._orig = self._orig, None
+            _os_chdir(orig)
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[Directory] Restored to '{orig}'")
+        return False
+    
+    def _close(self) -> None:
+        """Close the saved directory descriptor, if any."""
+        if self._fd is not None:
+            _os_close(self._fd)
+            self._fd = None
 
 
-@contextmanager
-def temporary_attribute(obj: Any, attr: str, value: Any) -> Generator[None, None, None]:
+# Marks an attribute that did not exist before (None may be a real value)
+_MISSING: Any = object()
+# Marks a TemporaryAttribute that has not saved an original value yet
+_NOT_SAVED: Any = object()
+
+
+class TemporaryAttribute:
     """
     Temporarily set an attribute on an object.
     
@@ -177,26 +330,48 @@ def temporary_attribute(obj: Any, attr: str, value: Any) -> Generator[None, None
         obj: The object to modify
         attr: The attribute name
         value: The temporary value to set
-        
-    Yields:
-        None
     """
-    # Save original value (or mark as non-existent)
-    has_attr = hasattr(obj, attr)
-    original_value = getattr(obj, attr, None) if has_attr else None
     
-    print(f"[TempAttr] Setting {attr} = {value}")
-    setattr(obj, attr, value)
-    
-    try:
-        yield
-    finally:
-        if has_attr:
-            print(f"[TempAttr] Restoring {attr} = {original_value}")
-            setattr(obj, attr, original_value)
+    __slots__ = ('obj', 'attr', 'value', 'orig')
+    
+    def __init__(self, obj: Any, attr: str, value: Any):
+        self.obj = obj
+        self.attr = attr
+        self.value = value
+        self.orig: Any = _NOT_SAVED
+    
+    def __enter__(self) -> None:
+        """Save the original value (or mark as non-existent) and set the new one."""
+        # Entering again would save the temporary value as the original
+        if self.orig is not _NOT_SAVED:
+            raise RuntimeError("TemporaryAttribute is not reentrant")
+        # One getattr with a sentinel: hasattr() would look the attribute
+        # up a second time (and raise and catch internally when it is missing)
+        self.orig = getattr(self.obj, self.attr, _MISSING)
+        
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[TempAttr] Setting {self.attr} = {self.value}")
+        setattr(self.obj, self.attr, self.value)
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        """Restore or remove the attribute."""
+        orig, self.orig = self.orig, _NOT_SAVED
+        if orig is _MISSING:
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[TempAttr] Removing {self.attr}")
+            delattr(self.obj, self.attr)
         else:
-            print(f"[TempAttr] Removing {attr}")
-            delattr(obj, attr)
+            if logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[TempAttr] Restoring {self.attr} = {orig}")
+            setattr(self.obj, self.attr, orig)
+        return False
+
+
+# Keep the original function-style names so existing callers don't change
+change_directory = ChangeDirectory
+temporary_attribute = TemporaryAttribute
 
 
 # =============================================================================
@@ -211,21 +386,40 @@ class SuppressExceptions:
     Demonstrates how to handle exceptions in __exit__.
     """
     
-    def __init__(self, *exceptions):
+    __slots__ = ('exceptions', 'verbose')
+    
+    def __new__(cls, *exceptions: Type[BaseException],
+                verbose: bool = False) -> "SuppressExceptions":
+        """
+        Pick the implementation once, when the object is created.
+        
+        With nothing to suppress, __exit__ has no work to do, so a no-op
+        subclass is returned instead of checking on every exit.
+        """
+        if cls is SuppressExceptions and not exceptions:
+            return _NoOpSuppress.__new__(_NoOpSuppress)
+        return super().__new__(cls)
+    
+    def __init__(self, *exceptions: Type[BaseException], verbose: bool = False):
         """
         Initialize with exception types to suppress.
         
         Args:
             *exceptions: Exception classes to suppress
+            verbose: Also report exceptions that are not suppressed
         """
         self.exceptions = exceptions
-        print(f"[Suppress] Will suppress: {[e.__name__ for e in exceptions]}")
+        self.verbose = verbose
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Suppress] Will suppress: {[e.__name__ for e in exceptions]}")
     
-    def __enter__(self):
+    def __enter__(self) -> "SuppressExceptions":
         """Enter the context."""
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> bool:
         """
         Exit the context, potentially suppressing exceptions.
         
@@ -233,10 +427,28 @@ class SuppressExceptions:
         Otherwise, return False to let it propagate.
         """
         if exc_type is not None:
-            if issubclass(exc_type, self.exceptions):
-                print(f"[Suppress] Suppressed {exc_type.__name__}: {exc_val}")
+            exceptions = self.exceptions
+            if issubclass(exc_type, exceptions):
+                if logger.isEnabledFor(_DEBUG):
+                    _log_debug(f"[Suppress] Suppressed {exc_type.__name__}: {exc_val}")
                 return True  # Suppress the exception
-            print(f"[Suppress] Not suppressing {exc_type.__name__}")
+            if self.verbose and logger.isEnabledFor(_DEBUG):
+                _log_debug(f"[Suppress] Not suppressing {exc_type.__name__}")
+        return False
+
+
+class _NoOpSuppress(SuppressExceptions):
+    """SuppressExceptions with no exception types: never suppresses anything."""
+    
+    __slots__ = ()
+    
+    def __init__(self, *exceptions: Type[BaseException], verbose: bool = False):
+        self.exceptions = ()
+        self.verbose = verbose
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
         return False
 
 
@@ -250,30 +462,45 @@ class TransactionManager:
     - Rollback on exception
     """
     
+    __slots__ = ('name', 'changes')
+    
     def __init__(self, transaction_name: str):
         """Initialize the transaction."""
         self.name = transaction_name
-        self.changes = []
+        # Created on the first add_change(); many transactions record nothing
+        self.changes: Optional[List[str]] = None
     
-    def __enter__(self):
+    def __enter__(self) -> "TransactionManager":
         """Begin the transaction."""
-        print(f"[Transaction] BEGIN: {self.name}")
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Transaction] BEGIN: {self.name}")
         return self
     
     def add_change(self, change: str):
         """Record a change in the transaction."""
+        if self.changes is None:
+            self.changes = []
         self.changes.append(change)
-        print(f"[Transaction] Change added: {change}")
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Transaction] Change added: {change}")
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
         """Commit or rollback based on success/failure."""
-        if exc_type is None:
-            print(f"[Transaction] COMMIT: {self.name}")
-            print(f"[Transaction] Applied changes: {self.changes}")
-        else:
-            print(f"[Transaction] ROLLBACK: {self.name}")
-            print(f"[Transaction] Discarded changes: {self.changes}")
-            self.changes.clear()
+        changes = self.changes
+        if logger.isEnabledFor(_DEBUG):
+            if exc_type is None:
+                _log_debug(f"[Transaction] COMMIT: {self.name}")
+                if changes:
+                    _log_debug(f"[Transaction] Applied changes: {changes}")
+            else:
+                _log_debug(f"[Transaction] ROLLBACK: {self.name}")
+                if changes:
+                    _log_debug(f"[Transaction] Discarded changes: {changes}")
+        
+        if exc_type is not None and changes:
+            changes.clear()
         
         return False  # Don't suppress exceptions
 
@@ -287,28 +514,40 @@ class ReentrantLock:
     A reentrant (nestable) lock context manager.
     
     Can be used in nested 'with' blocks without deadlock.
-    Tracks the recursion level and only releases when
-    fully exited.
+    threading.RLock already tracks the recursion level itself and
+    only releases the lock when it is fully exited, so no extra
+    counter is kept here.
     """
     
-    def __init__(self, name: str = "lock"):
-        """Initialize the lock."""
+    __slots__ = ('name', 'debug', '_lock')
+    
+    def __init__(self, name: str = "lock", debug: bool = False):
+        """
+        Initialize the lock.
+        
+        Args:
+            name: Name used in debug messages
+            debug: Log a DEBUG message on every acquire and release
+                (requires the module logger at DEBUG)
+        """
         self.name = name
+        self.debug = debug
         self._lock = threading.RLock()
-        self._count = 0
     
-    def __enter__(self):
+    def __enter__(self) -> "ReentrantLock":
         """Acquire the lock."""
         self._lock.acquire()
-        self._count += 1
-        print(f"[Lock] Acquired '{self.name}' (level {self._count})")
+        if self.debug and logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Lock] Acquired '{self.name}'")
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
         """Release the lock."""
-        self._count -= 1
         self._lock.release()
-        print(f"[Lock] Released '{self.name}' (level {self._count})")
+        if self.debug and logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[Lock] Released '{self.name}'")
         return False
 
 
@@ -316,7 +555,7 @@ class ReentrantLock:
 # SECTION 6: ExitStack for Dynamic Context Management
 # =============================================================================
 
-def demonstrate_exitstack():
+def demonstrate_exitstack() -> None:
     """
     Demonstrate ExitStack for managing multiple context managers.
     
@@ -324,24 +563,41 @@ def demonstrate_exitstack():
     - The number of context managers is determined at runtime
     - You need to conditionally enter context managers
     - You want to manage cleanup callbacks
+    
+    ExitStack keeps an internal stack of exit callbacks and wraps each
+    one it is given. When the number of context managers is fixed, a
+    plain 'with' statement listing them is simpler and cheaper.
     """
     print("\n--- ExitStack Demonstration ---")
     
+    # The tasks could come from a config file or user input
+    tasks = ["Task 1", "Task 2"]
+    
     with ExitStack() as stack:
         # Dynamically add context managers
-        timer1 = stack.enter_context(Timer("Task 1"))
-        timer2 = stack.enter_context(Timer("Task 2"))
+        timers = [stack.enter_context(Timer(task)) for task in tasks]
         
         # Add a cleanup callback
-        def cleanup():
+        def cleanup() -> None:
             print("[ExitStack] Running cleanup callback")
         stack.callback(cleanup)
         
         # Simulate work
         time.sleep(0.1)
-        print("[ExitStack] Work completed")
+        print(f"[ExitStack] Work completed ({len(timers)} timers)")
     
     print("[ExitStack] All contexts exited")
+    
+    # When the context managers are known when writing the code, list
+    # them in one 'with' statement instead. The unwinding order is the
+    # same: the cleanup, then Task 2, then Task 1.
+    print("\n--- Fixed Number of Context Managers ---")
+    with Timer("Task 1"), Timer("Task 2"):
+        try:
+            time.sleep(0.1)
+            print("[With] Work completed")
+        finally:
+            print("[With] Running cleanup")
 
 
 # =============================================================================
@@ -361,20 +617,26 @@ class AsyncResource:
     an async event loop (asyncio.run).
     """
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         """Initialize the async resource."""
         self.name = name
     
-    async def __aenter__(self):
+    async def __aenter__(self) -> "AsyncResource":
         """Async enter - can await async operations."""
-        print(f"[AsyncResource] Acquiring {self.name}")
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[AsyncResource] Acquiring {self.name}")
         # Simulate async acquisition
         # await asyncio.sleep(0.1)
         return self
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]],
+                        exc_val: Optional[BaseException],
+                        exc_tb: Optional[TracebackType]) -> Literal[False]:
         """Async exit - can await async operations."""
-        print(f"[AsyncResource] Releasing {self.name}")
+        if logger.isEnabledFor(_DEBUG):
+            _log_debug(f"[AsyncResource] Releasing {self.name}")
         # Simulate async release
         # await asyncio.sleep(0.1)
         return False
@@ -384,50 +646,105 @@ class AsyncResource:
 # SECTION 8: Practical Example - Logging Context
 # =============================================================================
 
+def _level_number(name: str) -> Optional[int]:
+    """Return the numeric logging level for name, or None if unknown."""
+    level = logging.getLevelName(name.upper())
+    return level if isinstance(level, int) else None
+
+
 class LoggingContext:
     """
     A context manager that provides structured logging.
     
     Logs entry and exit of code blocks with timing and
     exception information.
+    
+    The duration is measured with time.perf_counter(), which is much
+    cheaper than datetime.now(). Wall-clock timestamps are only turned
+    into ISO strings when a message is actually printed.
+    
+    Contexts whose level is below LoggingContext.threshold are created
+    as a silent variant that does nothing on enter and exit, so disabled
+    logging costs almost nothing.
     """
     
+    __slots__ = ('operation', 'log_level', 'start_time', '_t0_mono')
+    
+    # Minimum level that is printed (set to e.g. "WARNING" to silence INFO)
+    threshold: ClassVar[str] = "DEBUG"
+    
+    def __new__(cls, operation: str, log_level: str = "INFO") -> "LoggingContext":
+        """Return the silent variant if log_level is below the threshold."""
+        if cls is LoggingContext:
+            # Unknown level names are never silenced
+            level = _level_number(log_level)
+            threshold = _level_number(cls.threshold)
+            if level is not None and threshold is not None and level < threshold:
+                return _SilentLoggingContext.__new__(_SilentLoggingContext,
+                                                     operation)
+        return super().__new__(cls)
+    
     def __init__(self, operation: str, log_level: str = "INFO"):
         """
         Initialize the logging context.
         
         Args:
             operation: Name of the operation being performed
-            log_level: Logging level (INFO, DEBUG, WARNING, ERROR)
+            log_level: Logging level name (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL; case-insensitive)
         """
         self.operation = operation
         self.log_level = log_level
-        self.start_time: Optional[datetime] = None
+        self.start_time: Optional[float] = None
+        self._t0_mono = 0.0
     
-    def __enter__(self):
+    def __enter__(self) -> "LoggingContext":
         """Log entry and start timing."""
-        self.start_time = datetime.now()
-        print(f"[{self.log_level}] {self.start_time.isoformat()} - "
+        self.start_time = _time()
+        self._t0_mono = _perf_counter()
+        print(f"[{self.log_level}] "
+              f"{_datetime_fromtimestamp(self.start_time).isoformat()} - "
               f"ENTER: {self.operation}")
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
         """Log exit with duration and status."""
-        end_time = datetime.now()
-        duration = (end_time - self.start_time).total_seconds()
+        duration = _perf_counter() - self._t0_mono
         
         if exc_type is None:
             status = "SUCCESS"
         else:
             status = f"FAILED ({exc_type.__name__}: {exc_val})"
         
-        print(f"[{self.log_level}] {end_time.isoformat()} - "
+        print(f"[{self.log_level}] "
+              f"{_datetime_fromtimestamp(_time()).isoformat()} - "
               f"EXIT: {self.operation} - {status} - "
               f"Duration: {duration:.4f}s")
         
         return False
 
 
+class _SilentLoggingContext(LoggingContext):
+    """LoggingContext below the active threshold: no timing, no output."""
+    
+    __slots__ = ()
+    
+    def __init__(self, operation: str, log_level: str = "INFO"):
+        self.operation = operation
+        self.log_level = log_level
+        self.start_time = None
+    
+    def __enter__(self) -> "LoggingContext":
+        return self
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        return False
+
+
 # =============================================================================
 # MAIN: Demonstration of All Context Manager Concepts
 # =============================================================================
@@ -436,6 +753,10 @@ def main():
     """
     Main function demonstrating all context manager examples.
     """
+    # Show the context managers' debug messages alongside the demo output
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    
     print("=" * 60)
     print("PYTHON CONTEXT MANAGERS DEMONSTRATION")
     print("=" * 60)
@@ -454,6 +775,10 @@ def main():
         content = f.read()
         print(f"File content: {content}")
     
+    # Binary mode skips the text decoding layer
+    with FileManager.binary(temp_file) as f:
+        print(f"Raw bytes: {f.read()!r}")
+    
     # 2. Timer Context Manager
     print("\n--- 2. Timer Context Manager ---")
     with Timer("Heavy computation") as timer:
@@ -462,6 +787,11 @@ def main():
         print(f"Computed sum: {total}")
     print(f"Elapsed time accessible: {timer.elapsed:.6f}s")
     
+    # FastTimer: no output, just the measurement
+    with FastTimer() as fast_timer:
+        total = sum(i ** 2 for i in range(100000))
+    print(f"FastTimer measured: {fast_timer.elapsed:.6f}s")
+    
     # 3. Change Directory Context Manager
     print("\n--- 3. Change Directory Context Manager ---")
     print(f"Current directory: {os.getcwd()}")
@@ -472,10 +802,8 @@ def main():
     # 4. Temporary Attribute Context Manager
     print("\n--- 4. Temporary Attribute Context Manager ---")
     
-    class Config:
-        debug = False
-    
-    config = Config()
+    # A simple namespace stands in for a configuration object
+    config = SimpleNamespace(debug=False)
     print(f"Before: debug = {config.debug}")
     with temporary_attribute(config, 'debug', True):
         print(f"Inside: debug = {config.debug}")
@@ -501,7 +829,7 @@ def main():
     
     # 7. Reentrant Lock
     print("\n--- 7. Reentrant Lock ---")
-    lock = ReentrantLock("data_lock")
+    lock = ReentrantLock("data_lock", debug=True)
     with lock:
         print("First level")
         with lock:
@@ -518,6 +846,11 @@ def main():
         time.sleep(0.1)  # Simulate work
         print("Fetching user data...")
     
+    # Below the threshold the silent variant is used: no timing, no output
+    with temporary_attribute(LoggingContext, 'threshold', "INFO"):
+        with LoggingContext("cache_lookup", log_level="DEBUG"):
+            print("Looking up cache (DEBUG context is silent)...")
+    
     # Cleanup
     if os.path.exists(temp_file):
         os.remove(temp_file)
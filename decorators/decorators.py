@@ -10,8 +10,9 @@ License: MIT
 """
 
 import functools
+import inspect
 import time
-from typing import Callable, Any
+from typing import Callable, Any, Optional, Tuple, Type
 
 
 # =============================================================================
@@ -91,7 +92,8 @@ def slow_function(n: int) -> int:
 # SECTION 3: Decorator with Arguments
 # =============================================================================
 
-def retry(max_attempts: int = 3, delay: float = 1.0):
+def retry(max_attempts: int = 3, delay: float = 1.0,
+          exceptions: Tuple[Type[BaseException], ...] = (Exception,)):
     """
     A decorator factory that retries a function if it raises an exception.
     
@@ -102,23 +104,30 @@ def retry(max_attempts: int = 3, delay: float = 1.0):
     Args:
         max_attempts: Maximum number of retry attempts (default: 3)
         delay: Delay between retries in seconds (default: 1.0)
+        exceptions: Exception types that trigger a retry (default: Exception)
         
     Returns:
         A decorator function
     """
     def decorator(func: Callable) -> Callable:
+        sleep = time.sleep
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
+            # Most calls succeed first time, so try once before the retry loop
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
             
-            for attempt in range(1, max_attempts + 1):
+            for attempt in range(2, max_attempts + 1):
+                print(f"[RETRY] Attempt {attempt - 1}/{max_attempts} failed: "
+                      f"{last_exception}")
+                sleep(delay)
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     last_exception = e
-                    print(f"[RETRY] Attempt {attempt}/{max_attempts} failed: {e}")
-                    if attempt < max_attempts:
-                        time.sleep(delay)
             
             # If all attempts fail, raise the last exception
             raise last_exception
@@ -143,7 +152,11 @@ def unstable_operation(success_rate: float = 0.5) -> str:
 # SECTION 4: Memoization Decorator (Caching)
 # =============================================================================
 
-def memoize(func: Callable) -> Callable:
+# Sentinel for "not in the cache" (None may be a legitimate cached value)
+_MISSING = object()
+
+
+def memoize(func: Optional[Callable] = None, *, debug: bool = False) -> Callable:
     """
     A memoization decorator that caches function results.
     
@@ -156,34 +169,62 @@ def memoize(func: Callable) -> Callable:
     - Functions with expensive computations
     - Functions that are called repeatedly with the same arguments
     
+    This hand-rolled version shows how caching works. In production code
+    prefer functools.lru_cache (see fibonacci below), which keeps the
+    cache logic in C.
+    
+    Can be used as @memoize or @memoize(debug=True).
+    
     Args:
         func: The function to be memoized
+        debug: Print a message on every cache hit and miss (default: False)
         
     Returns:
         A wrapper function with caching capability
     """
-    cache = {}
-    
-    @functools.wraps(func)
-    def wrapper(*args):
-        # Create a cache key from the arguments
-        if args not in cache:
-            cache[args] = func(*args)
-            print(f"[CACHE] Computing and caching result for {func.__name__}{args}")
-        else:
-            print(f"[CACHE] Using cached result for {func.__name__}{args}")
-        return cache[args]
+    def decorator(func: Callable) -> Callable:
+        cache = {}
+        # Bind the method once so each call skips the attribute lookup
+        cache_get = cache.get
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            # A single dict probe: the sentinel tells a miss apart from
+            # a cached result that happens to be None
+            result = cache_get(args, _MISSING)
+            if result is _MISSING:
+                result = cache[args] = func(*args)
+                if debug:
+                    print(f"[CACHE] Computing and caching result for "
+                          f"{func.__name__}{args}")
+            elif debug:
+                print(f"[CACHE] Using cached result for {func.__name__}{args}")
+            return result
+        
+        return wrapper
     
-    return wrapper
+    if func is None:
+        return decorator
+    return decorator(func)
+
 
+@memoize(debug=True)
+def square(n: int) -> int:
+    """Square a number. Used to show the memoize cache messages."""
+    return n * n
 
-@memoize
+
+@functools.lru_cache(maxsize=None)
 def fibonacci(n: int) -> int:
     """
     Calculate the nth Fibonacci number using recursion.
     
     Without memoization, this would have exponential time complexity.
     With memoization, it becomes linear!
+    
+    functools.lru_cache is the standard library's memoization decorator.
+    Its cache lookup is implemented in C, so each recursive call avoids
+    an extra Python-level wrapper frame.
     """
     if n < 2:
         return n
@@ -271,23 +312,61 @@ def validate_types(**expected_types):
             return x + y
     """
     def decorator(func: Callable) -> Callable:
+        # Inspect the signature once, when the decorator is applied,
+        # rather than on every call
+        sig = inspect.signature(func)
+        empty = inspect.Parameter.empty
+        
+        # Parameters that can be filled by position, in order
+        positional = []
+        for param in sig.parameters.values():
+            if param.kind not in (inspect.Parameter.POSITIONAL_ONLY,
+                                  inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                break
+            positional.append(param)
+        
+        # (index, name, type, default) for each checked positional parameter
+        checks = [
+            (index, param.name, expected_types[param.name], param.default)
+            for index, param in enumerate(positional)
+            if param.name in expected_types
+        ]
+        # The positional fast path only works if every checked name is positional
+        fast = len(checks) == len(
+            [name for name in expected_types if name in sig.parameters]
+        )
+        
+        def check(param_name, value, expected_type):
+            if not isinstance(value, expected_type):
+                raise TypeError(
+                    f"Argument '{param_name}' must be {expected_type.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function parameter names
-            import inspect
-            sig = inspect.signature(func)
+            if fast and not kwargs:
+                # Map positional arguments to parameters by index
+                n_args = len(args)
+                for index, param_name, expected_type, default in checks:
+                    if index < n_args:
+                        value = args[index]
+                    elif default is not empty:
+                        value = default
+                    else:
+                        break  # Missing argument: let sig.bind report it
+                    check(param_name, value, expected_type)
+                else:
+                    return func(*args, **kwargs)
+            
+            # General case: bind keyword arguments to parameter names
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
             
             # Check each argument against expected type
             for param_name, expected_type in expected_types.items():
                 if param_name in bound_args.arguments:
-                    value = bound_args.arguments[param_name]
-                    if not isinstance(value, expected_type):
-                        raise TypeError(
-                            f"Argument '{param_name}' must be {expected_type.__name__}, "
-                            f"got {type(value).__name__}"
-                        )
+                    check(param_name, bound_args.arguments[param_name], expected_type)
             
             return func(*args, **kwargs)
         
@@ -335,6 +414,9 @@ def main():
     print("\n--- 4. Memoization Decorator ---")
     print(f"fibonacci(10) = {fibonacci(10)}")
     print(f"fibonacci(10) again = {fibonacci(10)}")  # Uses cache
+    print(f"Cache info: {fibonacci.cache_info()}")
+    print(f"square(4) = {square(4)}")
+    print(f"square(4) again = {square(4)}")  # Uses cache
     
     # 5. Singleton Decorator
     print("\n--- 5. Singleton Decorator ---")
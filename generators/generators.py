@@ -9,8 +9,29 @@ Author: Simply-Python Contributors
 License: MIT
 """
 
-from typing import Iterator, Generator, Any, List
+from collections import namedtuple
+from functools import lru_cache
+from itertools import chain as _itertools_chain, islice
+from typing import (Callable, Iterable, Iterator, Generator, Any, List,
+                    Optional, Sequence, Tuple)
+import csv
+import gc
+import os
 import sys
+import tempfile
+import timeit
+import tracemalloc
+
+# NumPy is optional: it is only used to show the compiled, array-based
+# alternative next to the pure-Python examples
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba and PyArrow are optional as well. They are slow to import, so they
+# are only imported by the functions that use them (fib_first_n and
+# process_csv_fast), not when this module is loaded.
 
 
 # =============================================================================
@@ -63,6 +84,36 @@ def demonstrate_basic_generator():
 # SECTION 2: Generator Expression
 # =============================================================================
 
+def measure_allocation(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """
+    Call build() and return its result with the bytes it allocated.
+    
+    sys.getsizeof() only reports the size of the object itself: for a
+    list that is the header plus the array of pointers, not the int
+    objects the pointers refer to. tracemalloc counts every allocation
+    made while build() runs, so it shows the real memory cost.
+    
+    Args:
+        build: A function with no arguments that creates the object
+        
+    Returns:
+        A (result, allocated_bytes) tuple
+    """
+    gc.collect()
+    # Leave an existing tracing session (e.g. python -X tracemalloc) running
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, after - before
+
+
 def compare_list_vs_generator():
     """
     Compare memory usage between list comprehension and generator expression.
@@ -74,19 +125,32 @@ def compare_list_vs_generator():
     print("\n--- List vs Generator Memory Comparison ---")
     
     # List comprehension - creates entire list in memory
-    numbers_list = [x ** 2 for x in range(1000)]
-    list_size = sys.getsizeof(numbers_list)
+    numbers_list, list_size = measure_allocation(
+        lambda: [x ** 2 for x in range(1000)])
     
     # Generator expression - generates values on demand
-    numbers_gen = (x ** 2 for x in range(1000))
-    gen_size = sys.getsizeof(numbers_gen)
+    numbers_gen, gen_size = measure_allocation(
+        lambda: (x ** 2 for x in range(1000)))
     
-    print(f"List comprehension size: {list_size:,} bytes")
-    print(f"Generator expression size: {gen_size:,} bytes")
+    print(f"List comprehension getsizeof: {sys.getsizeof(numbers_list):,} bytes "
+          f"(pointer array only)")
+    print(f"List comprehension allocated: {list_size:,} bytes")
+    print(f"Generator expression allocated: {gen_size:,} bytes")
     print(f"Memory saved: {((list_size - gen_size) / list_size * 100):.1f}%")
     
+    # NumPy array - the squaring runs as one C loop over a packed int64
+    # buffer, 8 bytes per value instead of a pointer plus an int object
+    if np is not None:
+        def build_array():
+            numbers_array = np.arange(1000, dtype=np.int64)
+            numbers_array *= numbers_array  # In place: no temporary array
+            return numbers_array
+        numbers_array, array_size = measure_allocation(build_array)
+        print(f"NumPy int64 array allocated: {array_size:,} bytes "
+              f"({numbers_array.nbytes:,} bytes of data)")
+    
     # Both produce the same results
-    print(f"First 5 squares from generator: {[next(numbers_gen) for _ in range(5)]}")
+    print(f"First 5 squares from generator: {list(islice(numbers_gen, 5))}")
 
 
 # =============================================================================
@@ -113,6 +177,66 @@ def fibonacci_generator() -> Generator[int, None, None]:
         a, b = b, a + b  # Calculate next Fibonacci number
 
 
+# fib(92) is the largest Fibonacci number that fits in a signed 64-bit int
+_MAX_INT64_FIB = 93
+
+
+def _fib_first_n_py(n: int) -> List[int]:
+    """Pure-Python version of fib_first_n (arbitrary-precision ints)."""
+    out = []
+    a, b = 0, 1
+    for _ in range(n):
+        out.append(a)
+        a, b = b, a + b
+    return out
+
+
+@lru_cache(maxsize=None)
+def _fib_first_n_jit() -> Optional[Callable[[int], Any]]:
+    """Compile the Numba version of fib_first_n on first use (None without Numba)."""
+    if np is None:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    @njit(cache=True)  # cache=True: compile once, reuse across runs
+    def fill(n):
+        """Fill a preallocated int64 array; compiled to machine code."""
+        out = np.empty(n, np.int64)
+        a, b = 0, 1
+        for i in range(n):
+            out[i] = a
+            a, b = b, a + b
+        return out
+    
+    return fill
+
+
+def fib_first_n(n: int) -> List[int]:
+    """
+    Return the first n Fibonacci numbers as a list.
+    
+    When you know up front how many values you need, a plain loop that
+    fills a list is cheaper than resuming a generator for every value.
+    If Numba is installed, the loop is compiled to machine code and the
+    two running values live in CPU registers.
+    
+    Args:
+        n: How many Fibonacci numbers to return
+        
+    Returns:
+        The first n Fibonacci numbers
+    """
+    # The compiled version uses int64, so large n needs Python's big ints
+    if 0 <= n <= _MAX_INT64_FIB:
+        fill = _fib_first_n_jit()
+        if fill is not None:
+            return fill(n).tolist()
+    return _fib_first_n_py(n)
+
+
 def demonstrate_infinite_generator():
     """Demonstrate infinite generator with limiting."""
     print("\n--- Infinite Fibonacci Generator ---")
@@ -120,16 +244,15 @@ def demonstrate_infinite_generator():
     fib = fibonacci_generator()
     
     # Get first 10 Fibonacci numbers
-    print("First 10 Fibonacci numbers:", end=" ")
-    for _ in range(10):
-        print(next(fib), end=" ")
-    print()
+    # islice() takes n values from an iterator in C, without a Python
+    # loop calling next() each time
+    print("First 10 Fibonacci numbers:", *islice(fib, 10))
     
     # Continue from where we left off
-    print("Next 5 Fibonacci numbers:", end=" ")
-    for _ in range(5):
-        print(next(fib), end=" ")
-    print()
+    print("Next 5 Fibonacci numbers:", *islice(fib, 5))
+    
+    # When the count is known, a batch function avoids the per-value resume
+    print(f"First 15 in one batch: {fib_first_n(15)}")
 
 
 # =============================================================================
@@ -162,6 +285,31 @@ def accumulator() -> Generator[float, float, None]:
             total += value
 
 
+class Accumulator:
+    """
+    A running total with the same send() interface as accumulator().
+    
+    Each send() to a generator resumes its frame. A small class with
+    __slots__ just runs a method, which is several times cheaper when
+    all you need is the running total. The coroutine form is still
+    the better fit when the accumulation is interleaved with other
+    work inside the generator.
+    
+    To sum a list of floats in one go, math.fsum() (exact) or sum()
+    is simpler and faster than either.
+    """
+    
+    __slots__ = ('total',)
+    
+    def __init__(self) -> None:
+        self.total = 0.0
+    
+    def send(self, value: float) -> float:
+        """Add value to the total and return the new total."""
+        self.total += value
+        return self.total
+
+
 def demonstrate_send():
     """Demonstrate generator send() method."""
     print("\n--- Generator with send() ---")
@@ -175,6 +323,11 @@ def demonstrate_send():
     print(f"After sending 10: {acc.send(10)}")
     print(f"After sending 20: {acc.send(20)}")
     print(f"After sending 5: {acc.send(5)}")
+    
+    # A slotted class gives the same running totals without the generator
+    acc_obj = Accumulator()
+    totals = [acc_obj.send(value) for value in (10, 20, 5)]
+    print(f"Accumulator class totals: {totals}")
 
 
 # =============================================================================
@@ -185,12 +338,18 @@ def read_numbers(data: List[int]) -> Generator[int, None, None]:
     """
     First stage: Read numbers from a data source.
     Simulates reading from a file or database.
+    
+    Note: over an in-memory list this stage only passes values through,
+    adding a generator resume per item for nothing. The pipeline below
+    skips it and hands the list straight to filter_even(); a stage like
+    this is worth having only when it really reads from a file or
+    database.
     """
     for number in data:
         yield number
 
 
-def filter_even(numbers: Iterator[int]) -> Generator[int, None, None]:
+def filter_even(numbers: Iterable[int]) -> Generator[int, None, None]:
     """
     Second stage: Filter to keep only even numbers.
     """
@@ -207,6 +366,86 @@ def square(numbers: Iterator[int]) -> Generator[int, None, None]:
         yield num ** 2
 
 
+class LengthHinted:
+    """
+    Wrap an iterator with a length estimate for list() to use.
+    
+    Generators have no length, so list(generator) starts small and
+    reallocates its storage several times as it grows. list() asks
+    the object it is given for __length_hint__() first, so providing
+    an upper bound lets it allocate once (and trim the excess at the
+    end).
+    
+    Example:
+        list(LengthHinted(square(filter_even(data)), len(data)))
+    """
+    
+    __slots__ = ('_iterator', '_hint')
+    
+    def __init__(self, iterator: Iterator[Any], hint: int):
+        """
+        Args:
+            iterator: The iterator to wrap
+            hint: Expected (or maximum) number of items
+        """
+        self._iterator = iterator
+        self._hint = hint
+    
+    def __iter__(self) -> Iterator[Any]:
+        return self._iterator
+    
+    def __length_hint__(self) -> int:
+        return self._hint
+
+
+def pipeline_fast(data: Iterable[int]) -> Generator[int, None, None]:
+    """
+    Filter and square in a single generator.
+    
+    Same result as square(filter_even(data)), but each item goes
+    through one generator instead of two, so there is one resume per
+    item instead of two. The staged version is easier to test and
+    reuse; the fused one is faster when the stages are fixed.
+    
+    (n & 1) == 0 tests the lowest bit, which is a cheaper operation
+    than n % 2 == 0.
+    """
+    for n in data:
+        if (n & 1) == 0:
+            yield n * n
+
+
+# Largest value whose square still fits in a signed 64-bit int
+_MAX_INT64_SQUARE_ROOT = 3037000499
+
+
+def pipeline_numpy(data: Sequence[int]) -> List[int]:
+    """
+    Vectorized version of pipeline_fast (requires NumPy).
+    
+    The filter and the square each run as one compiled loop over the
+    whole array instead of a Python step per item.
+    
+    NumPy works on fixed-size int64 values, which silently wrap around
+    instead of growing like Python ints. Inputs that are not all ints,
+    or whose values or squares don't fit in int64, are handed to
+    pipeline_fast() instead, so the result (or error) is the same.
+    """
+    if np is None:
+        raise ImportError("pipeline_numpy() requires NumPy")
+    a = np.asarray(data)
+    # Floats, objects (ints too big for 64 bits) and unsigned values past
+    # the int64 range can't be cast to int64 without changing them
+    if a.dtype.kind not in "ib":
+        return list(pipeline_fast(data))
+    a = a.astype(np.int64, copy=False)
+    evens = a[(a & 1) == 0]
+    if ((evens > _MAX_INT64_SQUARE_ROOT)
+            | (evens < -_MAX_INT64_SQUARE_ROOT)).any():
+        return list(pipeline_fast(data))
+    return (evens * evens).tolist()
+
+
 def demonstrate_pipeline():
     """
     Demonstrate generator pipeline for data processing.
@@ -225,12 +464,25 @@ def demonstrate_pipeline():
     data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     print(f"Original data: {data}")
     
-    # Create the pipeline
-    pipeline = square(filter_even(read_numbers(data)))
+    # Create the pipeline (a list is already iterable, so no read stage).
+    # Filtering can only drop items, so len(data) is an upper bound
+    # that lets list() allocate its result once.
+    pipeline = LengthHinted(square(filter_even(data)), len(data))
     
     # Process the pipeline
     results = list(pipeline)
     print(f"After pipeline (even numbers squared): {results}")
+    print(f"Fused pipeline gives the same result: {list(pipeline_fast(data))}")
+    if np is not None:
+        print(f"NumPy version gives the same result: {pipeline_numpy(data)}")
+    
+    # Compare the cost of three stages vs one on a larger input
+    big_data = list(range(10000))
+    staged = timeit.timeit(
+        lambda: list(square(filter_even(big_data))), number=20)
+    fused = timeit.timeit(lambda: list(pipeline_fast(big_data)), number=20)
+    print(f"Staged pipeline: {staged:.4f}s, fused pipeline: {fused:.4f}s "
+          f"(20 runs over {len(big_data):,} items)")
 
 
 # =============================================================================
@@ -256,8 +508,11 @@ class Range:
         Args:
             start: Starting value (or stop if stop is None)
             stop: Stopping value (exclusive)
-            step: Step size between values
+            step: Step size between values (must not be zero)
         """
+        # Like range(): a zero step would never reach stop
+        if step == 0:
+            raise ValueError("step must not be zero")
         if stop is None:
             self.start = 0
             self.stop = start
@@ -266,6 +521,11 @@ class Range:
             self.stop = stop
         self.step = step
         self.current = self.start
+        # Multiplying by the sign of step turns both stop conditions
+        # (current >= stop going up, current <= stop going down)
+        # into a single comparison in __next__
+        self._sign = 1 if step > 0 else -1
+        self._stop_signed = self.stop * self._sign
     
     def __iter__(self):
         """
@@ -279,13 +539,35 @@ class Range:
         Return the next value in the sequence.
         Raises StopIteration when the sequence is exhausted.
         """
-        if (self.step > 0 and self.current >= self.stop) or \
-           (self.step < 0 and self.current <= self.stop):
+        if self.current * self._sign >= self._stop_signed:
             raise StopIteration
         
         value = self.current
         self.current += self.step
         return value
+    
+    def __length_hint__(self) -> int:
+        """
+        Return how many values are left.
+        
+        list() and tuple() call this to allocate the result once,
+        instead of growing it step by step while iterating.
+        """
+        # ceil((stop - current) / step) with floor division, so it is
+        # exact for ints and also works for float ranges
+        remaining = -((self.current - self.stop) // self.step)
+        return max(0, int(remaining))
+    
+    def to_array(self):
+        """
+        Return the remaining values as a NumPy array (requires NumPy).
+        
+        np.arange fills the whole array in one call in compiled code,
+        with no Python-level __next__ call per element.
+        """
+        if np is None:
+            raise ImportError("Range.to_array() requires NumPy")
+        return np.arange(self.current, self.stop, self.step)
 
 
 def demonstrate_custom_iterator():
@@ -296,13 +578,18 @@ def demonstrate_custom_iterator():
     print("Range(5):", list(Range(5)))
     print("Range(2, 8):", list(Range(2, 8)))
     print("Range(10, 0, -2):", list(Range(10, 0, -2)))
+    
+    # __length_hint__ lets list() size its result up front
+    print("Length hint for Range(10, 0, -2):", Range(10, 0, -2).__length_hint__())
+    if np is not None:
+        print("Range(10, 0, -2).to_array():", Range(10, 0, -2).to_array())
 
 
 # =============================================================================
 # SECTION 7: yield from - Delegating to Sub-generators
 # =============================================================================
 
-def flatten(nested_list: List) -> Generator[Any, None, None]:
+def flatten_recursive(nested_list: List) -> Generator[Any, None, None]:
     """
     Recursively flatten a nested list structure.
     
@@ -312,33 +599,72 @@ def flatten(nested_list: List) -> Generator[Any, None, None]:
     But 'yield from' is more efficient and handles edge cases
     like exceptions and send() properly.
     
+    Each level of nesting creates another generator, and every value
+    is passed up through all of them. See flatten() below for a version
+    that uses a single generator.
+    
     Args:
-        nested_list: A potentially nested list structure
+        nested_list: A potentially nested list (or tuple) structure
         
     Yields:
         Each non-list element from the nested structure
     """
     for item in nested_list:
-        if isinstance(item, list):
+        if isinstance(item, (list, tuple)):
             # Delegate to recursive call
-            yield from flatten(item)
+            yield from flatten_recursive(item)
         else:
             yield item
 
 
-def chain(*iterables) -> Generator[Any, None, None]:
+def flatten(nested_list: List) -> Generator[Any, None, None]:
+    """
+    Flatten a nested list structure using an explicit stack.
+    
+    Produces the same values as flatten_recursive(), but keeps a stack
+    of iterators instead of one generator per nesting level. Each value
+    is yielded once, directly to the caller, however deep it is.
+    
+    Args:
+        nested_list: A potentially nested list (or tuple) structure
+        
+    Yields:
+        Each non-list element from the nested structure
+    """
+    stack = [iter(nested_list)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, (list, tuple)):
+                # Descend: finish the sub-list before continuing this one
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            # This level is exhausted: go back up
+            stack.pop()
+
+
+def chain(*iterables) -> Iterator[Any]:
     """
     Chain multiple iterables together.
     Similar to itertools.chain().
     
+    Written with 'yield from', this would be:
+        for iterable in iterables:
+            yield from iterable
+    
+    That runs a Python generator frame for every item. This version
+    hands the work to itertools.chain.from_iterable(), a single C
+    iterator over all the sources - use itertools directly in
+    production code.
+    
     Args:
         *iterables: Variable number of iterables to chain
         
-    Yields:
-        Each element from each iterable in order
+    Returns:
+        An iterator over each element from each iterable in order
     """
-    for iterable in iterables:
-        yield from iterable
+    return _itertools_chain.from_iterable(iterables)
 
 
 def demonstrate_yield_from():
@@ -348,7 +674,8 @@ def demonstrate_yield_from():
     # Flatten nested list
     nested = [1, [2, 3, [4, 5]], 6, [7, [8, 9]]]
     print(f"Nested list: {nested}")
-    print(f"Flattened: {list(flatten(nested))}")
+    print(f"Flattened (recursive): {list(flatten_recursive(nested))}")
+    print(f"Flattened (explicit stack): {list(flatten(nested))}")
     
     # Chain iterables
     result = list(chain([1, 2], "ab", (3, 4)))
@@ -359,7 +686,9 @@ def demonstrate_yield_from():
 # SECTION 8: Generator for Large File Processing
 # =============================================================================
 
-def read_large_file_lines(filename: str) -> Generator[str, None, None]:
+def read_large_file_lines(filename: str,
+                          encoding: str = 'utf-8',
+                          buffering: int = -1) -> Generator[str, None, None]:
     """
     Read a large file line by line without loading it entirely into memory.
     
@@ -367,41 +696,92 @@ def read_large_file_lines(filename: str) -> Generator[str, None, None]:
     Reading a 10GB file with a list would crash most computers.
     With a generator, we only hold one line in memory at a time.
     
+    Iterating over a text file already reads it in buffered chunks and
+    splits lines in C; a larger buffering value means fewer read calls
+    on very large files.
+    
     Args:
         filename: Path to the file to read
+        encoding: Text encoding of the file (default: UTF-8)
+        buffering: Read buffer size in bytes (default: the system default)
         
     Yields:
         Each line from the file (stripped of whitespace)
     """
-    with open(filename, 'r') as file:
+    with open(filename, 'r', encoding=encoding, buffering=buffering) as file:
         for line in file:
             yield line.strip()
 
 
-def process_csv_lazily(lines: Iterator[str]) -> Generator[dict, None, None]:
+def process_csv_lazily(lines: Iterable[str]) -> Generator[Tuple[str, ...], None, None]:
     """
-    Process CSV data lazily, converting each line to a dictionary.
+    Process CSV data lazily, converting each line to a named tuple.
     
     This demonstrates how generators can be chained for
     memory-efficient data processing pipelines.
     
+    csv.reader parses each line in C and handles quoted fields
+    (e.g. "New York, NY") that a plain split(',') would break.
+    The named tuple class is built once from the header, so each row
+    is a single tuple that shares its field names with every other row,
+    which is smaller and faster to build than one dict per row.
+    Call row._asdict() if a dictionary is needed.
+    
+    Blank lines are skipped. Short rows are padded with '' and long
+    rows are truncated, so every row has one field per header column.
+    
     Args:
-        lines: Iterator of CSV lines (first line is header)
+        lines: Iterable of CSV lines (first line is header)
         
     Yields:
-        Dictionary representing each row
+        Named tuple representing each row
     """
+    reader = csv.reader(lines)
+    
     # Get header from first line
     # Handle empty iterator case
     try:
-        header = next(lines).split(',')
+        header = next(reader)
     except StopIteration:
         return  # Empty iterator, nothing to yield
     
+    # rename=True replaces headers that aren't valid identifiers
+    Row = namedtuple('Row', header, rename=True)
+    
+    width = len(header)
+    padding = ('',) * width
+    
     # Process remaining lines
-    for line in lines:
-        values = line.split(',')
-        yield dict(zip(header, values))
+    for values in reader:
+        if not values:
+            continue  # csv.reader gives [] for a blank line
+        if len(values) != width:
+            # Ragged row: fill missing fields with '' and drop extras
+            values = (values + list(padding))[:width]
+        yield Row._make(values)
+
+
+def process_csv_fast(path: str):
+    """
+    Read a whole CSV file into a PyArrow Table (requires PyArrow).
+    
+    process_csv_lazily() is the right tool when rows must be streamed
+    one at a time. When the whole file is needed, pyarrow.csv parses
+    it in compiled, multi-threaded code and stores each column as one
+    contiguous array, so later per-column work can be vectorized too.
+    Use table.to_pylist() only if a dict per row is really needed.
+    
+    Args:
+        path: Path to the CSV file (first line is header)
+        
+    Returns:
+        A pyarrow.Table with one column per CSV field
+    """
+    try:
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        raise ImportError("process_csv_fast() requires PyArrow") from None
+    return pa_csv.read_csv(path)
 
 
 def demonstrate_file_processing():
@@ -413,7 +793,8 @@ def demonstrate_file_processing():
         "name,age,city",
         "Alice,30,New York",
         "Bob,25,Los Angeles",
-        "Charlie,35,Chicago"
+        "Charlie,35,Chicago",
+        'Dana,28,"Washington, D.C."'
     ]
     
     # Process lazily
@@ -422,6 +803,26 @@ def demonstrate_file_processing():
     print("Processing CSV records one at a time:")
     for record in records:
         print(f"  {record}")
+    
+    # The same pipeline reading from a real file, one line at a time
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "people.csv")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(csv_data) + "\n")
+        
+        print("Processing the same records from a file:")
+        for record in process_csv_lazily(read_large_file_lines(path)):
+            print(f"  {record}")
+        
+        # Whole-file, columnar parsing when PyArrow is installed
+        try:
+            table = process_csv_fast(path)
+        except ImportError:
+            pass
+        else:
+            print(f"PyArrow table: {table.num_rows} rows, "
+                  f"columns {table.column_names}")
+            print(f"  city column: {table.column('city').to_pylist()}")
 
 
 # =============================================================================
@@ -8,6 +8,13 @@ Author: Simply-Python Contributors
 License: MIT
 """
 
+# NumPy is optional: it is only used to show array-based alternatives
+# next to the lambda examples
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # =============================================================================
 # SECTION 1: Basic Lambda Function
@@ -66,6 +73,16 @@ def demonstrate_lambda_with_builtins():
     words = ["apple", "pie", "banana", "cat"]
     by_length = sorted(words, key=lambda w: len(w))
     print(f"Sorted by length: {by_length}")
+    
+    # The NumPy equivalents: each operation is one loop in C over the
+    # whole array, with no Python function call per element
+    if np is not None:
+        a = np.asarray(numbers)
+        print(f"Squared (NumPy): {(a * a).tolist()}")
+        print(f"Even numbers (NumPy): {a[a % 2 == 0].tolist()}")
+        w = np.array(words)
+        order = np.argsort(np.char.str_len(w), kind="stable")
+        print(f"Sorted by length (NumPy): {w[order].tolist()}")
 
 
 # =============================================================================
@@ -99,6 +116,17 @@ def demonstrate_lambda_sorting():
     # Sort in reverse order
     by_age_desc = sorted(people, key=lambda p: p[1], reverse=True)
     print(f"Sorted by age (descending): {by_age_desc}")
+    
+    # Struct-of-arrays alternative: keep each field in its own array.
+    # argsort compares packed int32 keys in C instead of calling a
+    # lambda and indexing a tuple for every element, which pays off
+    # once there are many rows.
+    if np is not None:
+        names = np.array([name for name, _ in people])
+        ages = np.array([age for _, age in people], dtype=np.int32)
+        order = np.argsort(ages, kind="stable")  # stable, like sorted()
+        by_age_soa = list(zip(names[order].tolist(), ages[order].tolist()))
+        print(f"Sorted by age (NumPy argsort): {by_age_soa}")
 
 
 # =============================================================================
@@ -127,6 +155,18 @@ def demonstrate_lambda_with_dict():
     for student in by_grade:
         print(f"  {student['name']}: {student['grade']}")
     
+    # The same records as a NumPy structured array: one compact row per
+    # student, sorted in C by the 'grade' field. Sorting the negated grades
+    # with a stable sort keeps ties in their original order, as
+    # sorted(..., reverse=True) does.
+    if np is not None:
+        records = np.array(
+            [(s["name"], s["grade"]) for s in students],
+            dtype=[("name", "U16"), ("grade", "i4")],
+        )
+        ranked = records[np.argsort(-records["grade"], kind="stable")]
+        print(f"By grade (NumPy structured sort): {ranked['name'].tolist()}")
+    
     # Extract all names
     names = list(map(lambda s: s["name"], students))
     print(f"All names: {names}")
@@ -9,6 +9,21 @@ Author: Simply-Python Contributors
 License: MIT
 """
 
+# NumPy is optional: it is only used to show array-based alternatives
+# next to the comprehension examples
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Set of vowels for O(1) membership tests (no .lower() call needed)
+VOWELS = frozenset("aeiouAEIOU")
+
+# str.translate() table that deletes every ASCII character except vowels
+ASCII_VOWELS_ONLY = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in VOWELS)
+)
+
 
 # =============================================================================
 # SECTION 1: Basic List Comprehension
@@ -98,6 +113,14 @@ def demonstrate_if_else_comprehension():
     # Transform based on condition
     modified = [x * 2 if x > 3 else x for x in numbers]
     print(f"Double if > 3: {modified}")
+    
+    # np.where evaluates the condition for the whole array and picks
+    # from either branch without a Python-level if per element
+    if np is not None:
+        a = np.asarray(numbers)
+        print(f"Even or 0 (NumPy): {np.where(a % 2 == 0, a, 0).tolist()}")
+        print(f"Labels (NumPy): {np.where(a % 2 == 0, 'even', 'odd').tolist()}")
+        print(f"Double if > 3 (NumPy): {np.where(a > 3, a * 2, a).tolist()}")
 
 
 # =============================================================================
@@ -124,6 +147,15 @@ def demonstrate_nested_comprehension():
     print(f"Multiplication table:")
     for row in table:
         print(f"  {row}")
+    
+    # With NumPy the matrix is one contiguous block of numbers, so
+    # flattening is a single copy and the table is one outer product.
+    # Keeping the results as arrays (skipping .tolist()) is faster
+    # still if more math follows.
+    if np is not None:
+        print(f"Flattened (NumPy): {np.asarray(matrix).ravel().tolist()}")
+        outer = np.outer(np.arange(1, 4), np.arange(1, 4))
+        print(f"Multiplication table (NumPy): {outer.tolist()}")
 
 
 # =============================================================================
@@ -141,9 +173,12 @@ def demonstrate_string_comprehension():
     
     # Extract vowels from a string
     text = "Hello World"
-    vowels = [char for char in text if char.lower() in "aeiou"]
+    vowels = [char for char in text if char in VOWELS]
     print(f"Vowels in '{text}': {vowels}")
     
+    # For ASCII text, str.translate() removes the other characters in C
+    print(f"Vowels as a string: '{text.translate(ASCII_VOWELS_ONLY)}'")
+    
     # Get word lengths
     sentence = "Python is awesome"
     words = sentence.split()